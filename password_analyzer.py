@@ -6,12 +6,79 @@ Author: Rohith D
 Version: 1.0.0
 """
 
+import bisect
+import functools
 import math
-import re
-from typing import Dict
-from colorama import Fore, Style
+import string
+import sys
+from typing import TYPE_CHECKING, Dict, List
 import argparse
 
+if TYPE_CHECKING:
+    import numpy
+
+_LOWER = frozenset(string.ascii_lowercase)
+_UPPER = frozenset(string.ascii_uppercase)
+_DIGITS = frozenset(string.digits)
+_SPECIALS = frozenset("!@#$%^&*()_+-=[]{};:'\"\\|,.<>?/")
+
+# Character class bits: lowercase, uppercase, digits, specials
+_CLASS_CHARS = (_LOWER, _UPPER, _DIGITS, _SPECIALS)
+_CLASS_SIZES = (26, 26, 10, 32)
+# Byte -> class bit translation table; non-ASCII and unclassified bytes map to 0
+_CLASS_TABLE = bytes(
+    sum(1 << bit for bit, chars in enumerate(_CLASS_CHARS) if chr(byte) in chars)
+    for byte in range(256)
+)
+_CHARSET_SIZES = tuple(
+    sum(size for bit, size in enumerate(_CLASS_SIZES) if mask & (1 << bit))
+    for mask in range(1 << len(_CLASS_SIZES))
+)
+_BITS_PER_CHAR = tuple(math.log2(size) if size else 0.0 for size in _CHARSET_SIZES)
+
+# Crack times are computed in the natural-log domain to avoid overflowing 2 ** entropy
+_LN2 = math.log(2)
+_LN10 = math.log(10)
+_LOG_FLOAT_MAX = math.log(sys.float_info.max)
+_TIME_UNITS = (  # (unit length in seconds, label)
+    (1, 'seconds'),
+    (60, 'minutes'),
+    (3600, 'hours'),
+    (86400, 'days'),
+    (2592000, 'months'),
+    (31536000, 'years'),
+)
+_LOG_THRESHOLDS = tuple(math.log(length) for length, _ in _TIME_UNITS)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_numba_kernel():
+    """
+    Compile the batch entropy kernel on first use.
+    
+    Returns:
+        The compiled kernel, or None if Numba is not installed
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+    
+    @njit(parallel=True, cache=True)
+    def entropy_kernel(buf, starts, ends, lengths, class_table, bits_per_char, masks, entropies):
+        # Each password occupies buf[starts[i]:ends[i]]; results go to masks and entropies
+        for i in prange(starts.shape[0]):
+            mask = 0
+            for j in range(starts[i], ends[i]):
+                mask |= class_table[buf[j]]
+                if mask == 15:
+                    break
+            masks[i] = mask
+            entropies[i] = lengths[i] * bits_per_char[mask]
+    
+    return entropy_kernel
+
+
 class PasswordAnalyzer:
     """
     Analyzes password strength based on multiple criteria.
@@ -22,6 +89,11 @@ class PasswordAnalyzer:
         'offline': 1e9,  # guesses per second
         'gpu': 1e11,  # guesses per second
     }
+    # log(2 * guesses per second): on average half the keyspace is searched
+    _LOG_CRACK_RATES = {speed: math.log(2 * rate) for speed, rate in CRACK_SPEEDS.items()}
+    
+    STRENGTH_THRESHOLDS = (30, 50, 70, 90, 120)  # entropy bits
+    STRENGTH_RATINGS = ('Very Weak', 'Weak', 'Fair', 'Good', 'Strong', 'Very Strong')
     
     def __init__(self, password: str):
         """
@@ -33,6 +105,40 @@ class PasswordAnalyzer:
         self.password = password
         self.length = len(password)
         self.metrics = {}
+        self.mask, self.flags = self._classify_characters()
+        self.charset_size = _CHARSET_SIZES[self.mask]
+    
+    def _classify_characters(self):
+        """
+        Classify the password's characters in a single pass.
+        
+        Returns:
+            Tuple of (character class bitmask, dictionary of character flags)
+        """
+        mask = 0
+        for bits in set(self.password.encode('latin-1', 'ignore').translate(_CLASS_TABLE)):
+            mask |= bits
+        flags = {
+            'has_lowercase': bool(mask & 1),
+            'has_uppercase': bool(mask & 2),
+            'has_numbers': bool(mask & 4),
+            'has_special': bool(mask & 8),
+            'no_spaces': ' ' not in self.password,
+        }
+        return mask, flags
+    
+    @functools.cached_property
+    def entropy(self) -> float:
+        """Password entropy in bits, computed once per instance."""
+        return self.length * _BITS_PER_CHAR[self.mask]
+    
+    @functools.cached_property
+    def patterns(self) -> Dict[str, bool]:
+        """Common password pattern checks, computed once per instance."""
+        return {
+            **self.flags,
+            'sufficient_length': self.length >= 12,
+        }
     
     def calculate_entropy(self) -> float:
         """
@@ -41,22 +147,7 @@ class PasswordAnalyzer:
         Returns:
             Entropy value in bits
         """
-        charset_size = 0
-        
-        if re.search(r'[a-z]', self.password):
-            charset_size += 26
-        if re.search(r'[A-Z]', self.password):
-            charset_size += 26
-        if re.search(r'[0-9]', self.password):
-            charset_size += 10
-        if re.search(r'[!@#$%^&*()_+\-=\[\]{};:\'\"\\|,.<>?/]', self.password):
-            charset_size += 32
-        
-        if charset_size == 0:
-            return 0
-        
-        entropy = self.length * math.log2(charset_size)
-        return entropy
+        return self.entropy
     
     def estimate_crack_time(self, entropy: float, speed: str = 'online') -> str:
         """
@@ -69,24 +160,30 @@ class PasswordAnalyzer:
         Returns:
             Human-readable time estimate
         """
-        possibilities = 2 ** entropy
-        guesses_per_second = self.CRACK_SPEEDS.get(speed, 100)
-        seconds = possibilities / guesses_per_second / 2  # on average
+        log_rate = self._LOG_CRACK_RATES.get(speed, self._LOG_CRACK_RATES['online'])
+        return self._format_log_seconds(entropy * _LN2 - log_rate)
+    
+    @staticmethod
+    def _format_log_seconds(log_seconds: float) -> str:
+        """
+        Format a duration given as the natural log of seconds.
         
-        if seconds < 1:
+        Args:
+            log_seconds: Natural log of the duration in seconds
+            
+        Returns:
+            Human-readable duration
+        """
+        index = bisect.bisect_right(_LOG_THRESHOLDS, log_seconds)
+        if index == 0:
             return 'Less than 1 second'
-        elif seconds < 60:
-            return f'{int(seconds)} seconds'
-        elif seconds < 3600:
-            return f'{int(seconds/60)} minutes'
-        elif seconds < 86400:
-            return f'{int(seconds/3600)} hours'
-        elif seconds < 2592000:
-            return f'{int(seconds/86400)} days'
-        elif seconds < 31536000:
-            return f'{int(seconds/2592000)} months'
-        else:
-            return f'{int(seconds/31536000)} years'
+        
+        length, label = _TIME_UNITS[index - 1]
+        log_count = log_seconds - _LOG_THRESHOLDS[index - 1]
+        if log_count >= _LOG_FLOAT_MAX:
+            exponent, mantissa = divmod(log_count / _LN10, 1)
+            return f'{10 ** mantissa:.2f}e+{int(exponent)} {label}'
+        return f'{max(1, int(math.exp(log_count)))} {label}'
     
     def check_common_patterns(self) -> Dict[str, bool]:
         """
@@ -95,14 +192,7 @@ class PasswordAnalyzer:
         Returns:
             Dictionary of pattern checks
         """
-        return {
-            'has_lowercase': bool(re.search(r'[a-z]', self.password)),
-            'has_uppercase': bool(re.search(r'[A-Z]', self.password)),
-            'has_numbers': bool(re.search(r'[0-9]', self.password)),
-            'has_special': bool(re.search(r'[!@#$%^&*()_+\-=\[\]{};:\'\"\\|,.<>?/]', self.password)),
-            'no_spaces': ' ' not in self.password,
-            'sufficient_length': self.length >= 12,
-        }
+        return dict(self.patterns)
     
     def get_strength_rating(self, entropy: float) -> str:
         """
@@ -114,18 +204,7 @@ class PasswordAnalyzer:
         Returns:
             Strength rating
         """
-        if entropy < 30:
-            return 'Very Weak'
-        elif entropy < 50:
-            return 'Weak'
-        elif entropy < 70:
-            return 'Fair'
-        elif entropy < 90:
-            return 'Good'
-        elif entropy < 120:
-            return 'Strong'
-        else:
-            return 'Very Strong'
+        return self.STRENGTH_RATINGS[bisect.bisect_right(self.STRENGTH_THRESHOLDS, entropy)]
     
     def analyze(self) -> Dict:
         """
@@ -134,22 +213,80 @@ class PasswordAnalyzer:
         Returns:
             Dictionary with all analysis results
         """
-        entropy = self.calculate_entropy()
-        patterns = self.check_common_patterns()
+        entropy = self.entropy
+        patterns = dict(self.patterns)
         strength = self.get_strength_rating(entropy)
+        crack_times = {speed: self.estimate_crack_time(entropy, speed) for speed in self.CRACK_SPEEDS}
         
         return {
             'password_length': self.length,
             'entropy_bits': round(entropy, 2),
             'strength': strength,
             'patterns': patterns,
-            'crack_time_online': self.estimate_crack_time(entropy, 'online'),
-            'crack_time_offline': self.estimate_crack_time(entropy, 'offline'),
-            'crack_time_gpu': self.estimate_crack_time(entropy, 'gpu'),
+            'crack_time_online': crack_times['online'],
+            'crack_time_offline': crack_times['offline'],
+            'crack_time_gpu': crack_times['gpu'],
         }
     
+    @classmethod
+    def analyze_batch(cls, passwords: List[str]) -> 'numpy.ndarray':
+        """
+        Score many passwords at once using vectorized NumPy operations.
+        
+        Uses a parallel Numba kernel when Numba is installed.
+        
+        Args:
+            passwords: Passwords to analyze
+            
+        Returns:
+            Structured array with length, mask, entropy and strength_idx
+            fields, where strength_idx indexes STRENGTH_RATINGS
+        """
+        import numpy as np
+        
+        encoded = [pw.encode('utf-8') for pw in passwords]
+        buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        sizes = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+        ends = np.cumsum(sizes)
+        starts = ends - sizes
+        bits_per_char = np.asarray(_BITS_PER_CHAR)
+        
+        results = np.zeros(len(encoded), dtype=[
+            ('length', np.int64),
+            ('mask', np.uint8),
+            ('entropy', np.float64),
+            ('strength_idx', np.uint8),
+        ])
+        results['length'] = np.fromiter(map(len, passwords), dtype=np.int64, count=len(passwords))
+        
+        class_table = np.frombuffer(_CLASS_TABLE, dtype=np.uint8)
+        kernel = _load_numba_kernel()
+        if kernel is not None:
+            masks = np.empty(len(encoded), dtype=np.uint8)
+            entropies = np.empty(len(encoded), dtype=np.float64)
+            kernel(buf, starts, ends, results['length'].copy(), class_table,
+                   bits_per_char, masks, entropies)
+            results['mask'] = masks
+            results['entropy'] = entropies
+        else:
+            # Tag every byte with its character class bit, then OR per password
+            bits = class_table[buf]
+            masks = np.zeros(len(encoded), dtype=np.uint8)
+            nonempty = sizes > 0
+            if nonempty.any():
+                masks[nonempty] = np.bitwise_or.reduceat(bits, starts[nonempty])
+            results['mask'] = masks
+            results['entropy'] = results['length'] * bits_per_char[masks]
+        
+        results['strength_idx'] = np.searchsorted(
+            cls.STRENGTH_THRESHOLDS, results['entropy'], side='right'
+        )
+        return results
+    
     def display_results(self):
         """Display analysis results with color formatting."""
+        from colorama import Fore, Style
+        
         results = self.analyze()
         
         print(f"\n{Fore.CYAN}{'='*60}")
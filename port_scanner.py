@@ -1,36 +1,72 @@
 """
 Port Scanner Tool - Security-Tools-Suite
-A multi-threaded TCP/UDP port scanner with service detection.
+An asyncio-based TCP/UDP port scanner with service detection.
 
 Author: Rohith D
 Version: 1.0.0
 """
 
+import asyncio
+import errno
+import itertools
+import os
+import random
+import select
 import socket
-import threading
-from concurrent.futures import ThreadPoolExecutor
-from colorama import Fore, Style
+import struct
+import time
 import argparse
 import json
-from typing import List, Dict
+from typing import Dict, Iterator, List
 import sys
 
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib serializer
+    orjson = None
+
+# Well-known service ports; likely to answer quickly, so they are probed first
+COMMON_PORTS = frozenset({
+    21, 22, 23, 25, 53, 80, 110, 139, 143, 443, 445,
+    3306, 3389, 5432, 5900, 8080, 8443,
+})
+
+# Predefined port sets; immutable so scanners can share them safely
+SCAN_PROFILES = {
+    'common': tuple(sorted(COMMON_PORTS)),
+    'default': range(1, 1001),
+    'full': range(1, 65536),
+}
+
 class PortScanner:
     """
-    Multi-threaded port scanner for network reconnaissance.
+    Asynchronous TCP connect scanner for network reconnaissance.
     """
     
+    SOCKETS_PER_THREAD = 20  # in-flight connections allowed per unit of `threads`
+    FD_HEADROOM = 64  # file descriptors kept free for the interpreter and event loop
+    SYN_BATCH = 256  # SYN probes sent between reads of the reply socket
+    SYN_BATCH_INTERVAL = 0.01  # seconds spent reading replies after each batch
+    SYN_SEND_RETRIES = 5  # attempts per probe when the kernel reports ENOBUFS
+    
     def __init__(self, target: str, ports: List[int], timeout: int = 1, threads: int = 50):
         """
         Initialize the port scanner.
         
         Args:
-            target: Target IP address or hostname
-            ports: List of ports to scan
+            target: Target IP address or hostname, resolved once here
+            ports: Ports to scan (any sequence of ints, e.g. a SCAN_PROFILES entry)
             timeout: Connection timeout in seconds
-            threads: Number of threads to use
+            threads: Concurrency level; up to threads * SOCKETS_PER_THREAD
+                connections are kept in flight
         """
         self.target = target
+        self.target_ip = socket.gethostbyname(target)
         self.ports = ports
         self.timeout = timeout
         self.threads = threads
@@ -38,6 +74,24 @@ class PortScanner:
         self.closed_ports = []
         self.filtered_ports = []
     
+    @classmethod
+    def from_profile(cls, profile: str, target: str, timeout: int = 1, threads: int = 50) -> 'PortScanner':
+        """
+        Create a scanner for one of the predefined SCAN_PROFILES.
+        
+        Args:
+            profile: Profile name ('common', 'default' or 'full')
+            target: Target IP address or hostname
+            timeout: Connection timeout in seconds
+            threads: Concurrency level
+            
+        Returns:
+            PortScanner bound to the shared profile port sequence
+        """
+        if profile not in SCAN_PROFILES:
+            raise ValueError(f"Unknown scan profile '{profile}'; choose from {', '.join(SCAN_PROFILES)}")
+        return cls(target, SCAN_PROFILES[profile], timeout, threads)
+    
     def scan_port(self, port: int) -> Dict[str, any]:
         """
         Scan a single port.
@@ -49,39 +103,234 @@ class PortScanner:
             Dictionary with scan results
         """
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(self.timeout)
-            result = sock.connect_ex((self.target, port))
-            sock.close()
-            
-            if result == 0:
-                self.open_ports.append(port)
-                return {'port': port, 'status': 'OPEN'}
-            else:
-                self.closed_ports.append(port)
-                return {'port': port, 'status': 'CLOSED'}
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                sock.settimeout(self.timeout)
+                result = sock.connect_ex((self.target_ip, port))
         except socket.timeout:
-            self.filtered_ports.append(port)
             return {'port': port, 'status': 'FILTERED'}
         except Exception as e:
             return {'port': port, 'status': 'ERROR', 'error': str(e)}
+        
+        # Same classification as _scan_one; a timed-out connect_ex returns EAGAIN
+        if result == 0:
+            return {'port': port, 'status': 'OPEN'}
+        if result == errno.ECONNREFUSED:
+            return {'port': port, 'status': 'CLOSED'}
+        if result in (errno.EAGAIN, errno.EWOULDBLOCK, errno.ETIMEDOUT):
+            return {'port': port, 'status': 'FILTERED'}
+        return {'port': port, 'status': 'ERROR', 'error': os.strerror(result)}
+    
+    def _collect(self, results: List[Dict]) -> List[Dict]:
+        """
+        Sort scan results into the open, closed and filtered port lists.
+        
+        Args:
+            results: Scan results from a completed scan
+            
+        Returns:
+            The same results, for chaining
+        """
+        buckets = {
+            'OPEN': self.open_ports,
+            'CLOSED': self.closed_ports,
+            'FILTERED': self.filtered_ports,
+        }
+        for result in results:
+            bucket = buckets.get(result['status'])
+            if bucket is not None:
+                bucket.append(result['port'])
+        return results
+    
+    async def _scan_one(self, port: int) -> Dict[str, any]:
+        """
+        Scan a single port on the event loop.
+        
+        Args:
+            port: Port number to scan
+            
+        Returns:
+            Dictionary with scan results
+        """
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.target_ip, port), self.timeout
+            )
+        except asyncio.TimeoutError:
+            return {'port': port, 'status': 'FILTERED'}
+        except ConnectionRefusedError:
+            return {'port': port, 'status': 'CLOSED'}
+        except Exception as e:
+            return {'port': port, 'status': 'ERROR', 'error': str(e)}
+        
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return {'port': port, 'status': 'OPEN'}
+    
+    def _scan_order(self) -> Iterator[int]:
+        """
+        Order ports so common services are probed before the rest.
+        
+        Returns:
+            Iterator over ports with COMMON_PORTS first, otherwise in their original order
+        """
+        return itertools.chain(
+            (port for port in self.ports if port in COMMON_PORTS),
+            (port for port in self.ports if port not in COMMON_PORTS),
+        )
+    
+    def _max_in_flight(self) -> int:
+        """
+        Number of connections to keep in flight at once.
+        
+        Returns:
+            threads * SOCKETS_PER_THREAD, capped below the open file limit
+        """
+        limit = self.threads * self.SOCKETS_PER_THREAD
+        if resource is not None:
+            soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+            if soft != resource.RLIM_INFINITY:
+                limit = min(limit, soft - self.FD_HEADROOM)
+        return max(1, limit)
+    
+    async def _run_async(self) -> List[Dict]:
+        """Scan all ports with a fixed pool of workers sharing one port iterator."""
+        pending = enumerate(self._scan_order())
+        results = {}
+        
+        async def worker():
+            for index, port in pending:
+                results[index] = await self._scan_one(port)
+        
+        workers = min(self._max_in_flight(), len(self.ports))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        return [results[index] for index in range(len(results))]
     
     def run(self) -> List[Dict]:
         """
-        Execute the port scan using multiple threads.
+        Execute the port scan on an asyncio event loop.
+        
+        Returns:
+            List of scan results, in scan order
+        """
+        return self._collect(asyncio.run(self._run_async()))
+    
+    @staticmethod
+    def _checksum(data: bytes) -> int:
+        """Compute the 16-bit ones' complement checksum used by TCP/IP."""
+        if len(data) % 2:
+            data += b'\x00'
+        total = sum(struct.unpack(f'!{len(data) // 2}H', data))
+        while total >> 16:
+            total = (total & 0xFFFF) + (total >> 16)
+        return ~total & 0xFFFF
+    
+    def _syn_packet(self, src_ip: bytes, dst_ip: bytes, src_port: int, dst_port: int, seq: int) -> bytes:
+        """
+        Build a TCP SYN segment; the kernel supplies the IP header.
         
+        Args:
+            src_ip: Packed source IPv4 address
+            dst_ip: Packed destination IPv4 address
+            src_port: Source port
+            dst_port: Destination port
+            seq: Initial sequence number
+            
         Returns:
-            List of scan results
+            TCP segment with a valid checksum
         """
+        header = struct.pack('!HHLLBBHHH', src_port, dst_port, seq, 0, 5 << 4, 0x02, 1024, 0, 0)
+        pseudo_header = struct.pack('!4s4sBBH', src_ip, dst_ip, 0, socket.IPPROTO_TCP, len(header))
+        checksum = self._checksum(pseudo_header + header)
+        return header[:16] + struct.pack('!H', checksum) + header[18:]
+    
+    def syn_scan(self) -> List[Dict]:
+        """
+        Execute a half-open SYN scan over a single raw socket.
+        
+        Requires root privileges on Linux. Ports answering SYN-ACK are OPEN,
+        RST are CLOSED, and ports with no reply within the timeout are FILTERED.
+        
+        Returns:
+            List of scan results, in completion order
+        """
+        # Learn which local address the kernel will route to the target from
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
+            probe.connect((self.target_ip, 1))
+            src_ip = socket.inet_aton(probe.getsockname()[0])
+        dst_ip = socket.inet_aton(self.target_ip)
+        src_port = random.randint(32768, 60999)
+        seq = random.getrandbits(32)
+        
         results = []
-        with ThreadPoolExecutor(max_workers=self.threads) as executor:
-            futures = [executor.submit(self.scan_port, port) for port in self.ports]
-            for future in futures:
-                results.append(future.result())
-        return results
+        pending = set(self.ports)
+        
+        def handle(packet):
+            """Classify a reply to one of our probes; other traffic is ignored."""
+            ihl = (packet[0] & 0x0F) * 4
+            if packet[12:16] != dst_ip or len(packet) < ihl + 14:
+                return
+            sport, dport, _, ack, _, flags = struct.unpack('!HHLLBB', packet[ihl:ihl + 14])
+            if dport != src_port or sport not in pending:
+                return
+            if flags & 0x12 == 0x12 and ack == (seq + 1) & 0xFFFFFFFF:
+                pending.discard(sport)
+                results.append({'port': sport, 'status': 'OPEN'})
+            elif flags & 0x04:
+                pending.discard(sport)
+                results.append({'port': sport, 'status': 'CLOSED'})
+        
+        def poll(sock):
+            """Handle replies that are already queued, up to one batch."""
+            for _ in range(self.SYN_BATCH):
+                if not select.select([sock], [], [], 0)[0]:
+                    return
+                handle(sock.recv(65535))
+        
+        def drain(sock, deadline):
+            """Handle replies until the deadline passes or nothing is pending."""
+            while pending:
+                wait = deadline - time.monotonic()
+                if wait <= 0:
+                    return
+                if select.select([sock], [], [], wait)[0]:
+                    handle(sock.recv(65535))
+        
+        def send(sock, port):
+            """Send one SYN probe, backing off while the kernel is out of buffers."""
+            packet = self._syn_packet(src_ip, dst_ip, src_port, port, seq)
+            for _ in range(self.SYN_SEND_RETRIES):
+                try:
+                    sock.sendto(packet, (self.target_ip, 0))
+                    return
+                except OSError as e:
+                    if e.errno != errno.ENOBUFS:
+                        raise
+                    error = e
+                    drain(sock, time.monotonic() + self.SYN_BATCH_INTERVAL)
+            pending.discard(port)
+            results.append({'port': port, 'status': 'ERROR', 'error': str(error)})
+        
+        with socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_TCP) as sock:
+            for sent, port in enumerate(self._scan_order(), 1):
+                send(sock, port)
+                poll(sock)
+                if sent % self.SYN_BATCH == 0:
+                    drain(sock, time.monotonic() + self.SYN_BATCH_INTERVAL)
+            
+            drain(sock, time.monotonic() + self.timeout)
+        
+        for port in self.ports:
+            if port in pending:
+                results.append({'port': port, 'status': 'FILTERED'})
+        return self._collect(results)
     
     def display_results(self):
         """Display scan results with color formatting."""
+        from colorama import Fore, Style
+        
         print(f"\n{Fore.CYAN}{'='*60}")
         print(f"Scan Results for {self.target}")
         print(f"{'='*60}{Style.RESET_ALL}\n")
@@ -103,29 +352,52 @@ class PortScanner:
             'closed_ports': self.closed_ports,
             'filtered_ports': self.filtered_ports
         }
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(data, f, indent=2)
 
 
 def main():
-    parser = argparse.ArgumentParser(description='Multi-threaded Port Scanner')
+    from colorama import Fore, Style
+    
+    parser = argparse.ArgumentParser(description='Asynchronous Port Scanner')
     parser.add_argument('-t', '--target', required=True, help='Target IP or hostname')
-    parser.add_argument('-p', '--ports', default='1-1000', help='Port range (e.g., 1-1000 or 22,80,443)')
+    parser.add_argument('-p', '--ports', help='Port range (e.g., 1-1000 or 22,80,443); overrides --profile')
+    parser.add_argument('--profile', choices=list(SCAN_PROFILES), default='default',
+                        help='Predefined port set: common services, 1-1000 (default) or all ports')
     parser.add_argument('-T', '--timeout', type=int, default=1, help='Timeout in seconds')
-    parser.add_argument('--threads', type=int, default=50, help='Number of threads')
+    parser.add_argument('--threads', type=int, default=50, help='Concurrency level')
     parser.add_argument('-o', '--output', help='Output JSON file')
+    parser.add_argument('--syn', action='store_true', help='Use a raw SYN scan (Linux, requires root)')
     
     args = parser.parse_args()
     
     # Parse ports
-    if '-' in args.ports:
+    if args.ports is None:
+        ports = SCAN_PROFILES[args.profile]
+    elif '-' in args.ports:
         start, end = map(int, args.ports.split('-'))
         ports = list(range(start, end + 1))
     else:
         ports = [int(p) for p in args.ports.split(',')]
     
-    scanner = PortScanner(args.target, ports, args.timeout, args.threads)
-    scanner.run()
+    if args.syn and (not sys.platform.startswith('linux') or os.geteuid() != 0):
+        print(f"{Fore.RED}SYN scan requires root privileges on Linux{Style.RESET_ALL}")
+        sys.exit(1)
+    
+    try:
+        scanner = PortScanner(args.target, ports, args.timeout, args.threads)
+    except socket.gaierror as e:
+        print(f"{Fore.RED}Could not resolve {args.target}: {e}{Style.RESET_ALL}")
+        sys.exit(1)
+    
+    if args.syn:
+        scanner.syn_scan()
+    else:
+        scanner.run()
     scanner.display_results()
     
     if args.output:
@@ -38,6 +38,10 @@ setup(
         "colorama>=0.4.6",
         "cryptography>=41.0.0",
     ],
+    extras_require={
+        "batch": ["numpy>=1.22.0", "numba>=0.57.0"],
+        "fast-json": ["orjson>=3.9.0"],
+    },
     entry_points={
         "console_scripts": [
             "port-scanner=port_scanner:main",